@@ -3,7 +3,14 @@ Expected Value (EV) calculations and bet quality evlauation.
 Uses probability and odds to determine long-term profitability of bets.
 """
 
-from odds import implied_probability
+import numpy as np
+
+from odds import (
+    american_to_decimal_vec,
+    implied_probability,
+    implied_probability_vec,
+    payout_profit,
+)
 
 def payout_from_american_odds(odds: int, stake: float) -> float:
     """Calculate the total payout from a bet given American odds and stake.
@@ -16,12 +23,7 @@ def payout_from_american_odds(odds: int, stake: float) -> float:
         float: The total payout from the bet.
     """
     
-    if odds == 0:
-        raise ValueError("Odds cannot be zero.")
-    if odds > 0:
-        return stake * (odds / 100)
-    else:
-        return stake * (100 / abs(odds))
+    return payout_profit(odds, stake)
     
 
 def expected_value(prob_win: float, odds: int, stake: float) -> float:
@@ -80,6 +82,7 @@ def evaluate_bet(prob_win: float, odds: int, stake: float) -> dict:
     
     Returns:
         dict: A dictionary containing expected value and bet quality rating.
+        Numbers are returned unrounded; format them when displaying.
     """
     implied_prob = implied_probability(odds)
     edge = prob_win - implied_prob
@@ -88,10 +91,49 @@ def evaluate_bet(prob_win: float, odds: int, stake: float) -> dict:
     verdict = "GOOD BET" if ev > 0 else "BAD BET"
 
     return {
-        "implied_probability": round(implied_prob, 4),
-        "estimated_probability": round(prob_win, 4),
-        "edge": round(edge, 4),
-        "expected_value": round(ev, 2),
+        "implied_probability": implied_prob,
+        "estimated_probability": prob_win,
+        "edge": edge,
+        "expected_value": ev,
         "verdict": verdict,
         "bet_quality": bet_quality(prob_win, odds)
-    }
\ No newline at end of file
+    }
+
+def evaluate_bets(prob_win, odds, stake) -> dict:
+    """
+    Vectorized evaluate_bet for a batch of bets.
+
+    Args:
+        prob_win (array-like): Estimated probabilities of winning (between 0 and 1).
+        odds (array-like): American odds. Positive for underdogs, negative for favorites.
+        stake (array-like or float): Amounts wagered; broadcast against prob_win and odds.
+
+    Returns:
+        dict: The same keys as evaluate_bet, each holding an array with one entry
+        per bet (values are not rounded). Pass it to pandas.DataFrame for a table.
+    """
+    prob_win = np.asarray(prob_win, dtype=float)
+    stake = np.asarray(stake, dtype=float)
+
+    if np.any((prob_win < 0) | (prob_win > 1)):
+        raise ValueError("Probability must be between 0 and 1.")
+
+    implied_prob = implied_probability_vec(odds)
+    payout_mult = american_to_decimal_vec(odds) - 1
+    edge = prob_win - implied_prob
+    ev = (prob_win * payout_mult * stake) - ((1 - prob_win) * stake)
+
+    quality = np.select(
+        [edge > 0.05, edge > 0, np.abs(edge) < 0.01],
+        ["STRONG POSITIVE EDGE", "SMALL POSITIVE EDGE", "BREAKEVEN"],
+        default="NEGATIVE EDGE",
+    )
+
+    return {
+        "implied_probability": implied_prob,
+        "estimated_probability": prob_win,
+        "edge": edge,
+        "expected_value": ev,
+        "verdict": np.where(ev > 0, "GOOD BET", "BAD BET"),
+        "bet_quality": quality,
+    }
@@ -0,0 +1,26 @@
+"""
+jit.py
+
+Optional Numba support shared by the strategy and simulation modules.
+
+When numba is installed, njit and prange are the real Numba objects. Otherwise
+njit is a no-op decorator and prange is range, so decorated kernels still run
+as plain Python and callers can check NUMBA_AVAILABLE to pick a faster
+NumPy path instead.
+
+Kernels are compiled with nogil=True: they touch only scalars and NumPy
+arrays, so they release the GIL and can also be driven from Python threads.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
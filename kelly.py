@@ -5,7 +5,9 @@ Kelly Criterion bet sizing for risk_managed wagering.
 Used to determine optimal fraction of bankroll to wager.
 """
 
-from odds import implied_probability
+import numpy as np
+
+from odds import american_to_decimal, american_to_decimal_vec, implied_probability
 
 def kelly_fraction(prob_win: float, odds: int) -> float:
     """
@@ -22,17 +24,34 @@ def kelly_fraction(prob_win: float, odds: int) -> float:
     if not (0 <= prob_win <= 1):
         raise ValueError("Probability must be between 0 and 1.")
     
-    
-    if odds > 0:
-        b = odds / 100
-    else:
-        b = 100 / abs(odds)
+    # Net odds (profit per unit staked), taken from the cached decimal conversion.
+    b = american_to_decimal(odds) - 1.0
     
     kelly_frac = (b * prob_win - (1 - prob_win)) / b
     
     return max(0.0, kelly_frac)  #Kelly never recommends betting if edge is negative
 
 
+def kelly_fraction_vec(prob_win, odds) -> np.ndarray:
+    """
+    Vectorized kelly_fraction for arrays of probabilities and American odds.
+
+    Args:
+        prob_win (array-like): Estimated probabilities of winning (between 0 and 1).
+        odds (array-like): American odds, broadcast against prob_win.
+
+    Returns:
+        np.ndarray: Kelly fractions, floored at 0.
+    """
+
+    prob_win = np.asarray(prob_win, dtype=float)
+    if np.any((prob_win < 0) | (prob_win > 1)):
+        raise ValueError("Probability must be between 0 and 1.")
+
+    b = american_to_decimal_vec(odds) - 1.0
+    return np.maximum(0.0, (b * prob_win - (1 - prob_win)) / b)
+
+
 def kelly_bet_size(
         prob_win: float,
         odds: int,
@@ -49,14 +68,14 @@ def kelly_bet_size(
         kelly_multiplier (float): A fraction of the Kelly fraction to use (between 0 and 1).
 
     Returns:
-        float: The optimal bet size.
+        float: The optimal bet size (unrounded; format it when displaying).
     """
     
     if bankroll <= 0:
         raise ValueError("Bankroll must be greater than zero.")
     
     fraction = kelly_fraction(prob_win, odds) * kelly_multiplier
-    return round(bankroll * fraction, 2)
+    return bankroll * fraction
 
 
 def risk_level(fraction: float) -> str:
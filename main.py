@@ -24,8 +24,8 @@ def print_summary(name: str, summary: dict) -> None:
 def plot_paths(sample_paths, title: str) -> None:
     """Plot multiple bankroll paths to visualize volatility and drawdowns."""
     plt.figure()
-    for path in sample_paths:
-        plt.plot(path)
+    # sample_paths is a 2D array, so one call draws every path as a column.
+    plt.plot(sample_paths.T)
     plt.title(title)
     plt.xlabel("Bet #")
     plt.ylabel("Bankroll")
@@ -1,9 +1,17 @@
 """Utility functions for working with betting odds.
 
 This module provides functions to convert between different formats of betting odds,
-including decimal, fractional, and American odds."""
+including decimal, fractional, and American odds.
 
+Conversions are memoized: sportsbook lines come from a small set of values
+(-110, -120, +100, ...), so repeated calls are served from the cache."""
 
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=256)
 def implied_probability(odds: int) -> float:
     """
     Calculate the implied probability from American odds.
@@ -19,13 +27,14 @@ def implied_probability(odds: int) -> float:
     if odds == 0:
         raise ValueError("Odds cannot be zero.")
     
-    if odds > 0:
-        probability = 100 / (odds + 100)
-    else:
-        probability = abs(odds) / (abs(odds) + 100)
+    # Risk / (risk + win) per 100 units: the favorite risks |odds| to win 100,
+    # the underdog risks 100 to win odds.
+    abs_odds = abs(odds)
+    probability = (100 if odds > 0 else abs_odds) / (abs_odds + 100)
     return probability
 
 
+@lru_cache(maxsize=256)
 def american_to_decimal(american_odds: int) -> float:
     """
     Convert American odds to decimal odds.
@@ -40,13 +49,65 @@ def american_to_decimal(american_odds: int) -> float:
     if american_odds == 0:
         raise ValueError("Odds cannot be zero.")
     
-    if american_odds > 0:
-        decimal_odds = 1 + (american_odds / 100)
-    else:
-        decimal_odds = 1 + (100 / abs(american_odds))
+    abs_odds = abs(american_odds)
+    decimal_odds = 1 + (abs_odds / 100 if american_odds > 0 else 100 / abs_odds)
     return decimal_odds
 
 
+def _validate_odds_array(odds) -> np.ndarray:
+    """Convert odds to a float array and reject zero entries."""
+
+    odds = np.asarray(odds, dtype=float)
+    if np.any(odds == 0):
+        raise ValueError("Odds cannot be zero.")
+    return odds
+
+
+def implied_probability_vec(odds) -> np.ndarray:
+    """
+    Vectorized implied_probability for an array of American odds.
+
+    Args:
+        odds (array-like): American odds. Positive for underdogs, negative for favorites.
+
+    Returns:
+        np.ndarray: Implied probabilities between 0 and 1.
+    """
+
+    odds = _validate_odds_array(odds)
+    abs_odds = np.abs(odds)
+    return np.where(odds > 0, 100.0, abs_odds) / (abs_odds + 100)
+
+
+def american_to_decimal_vec(odds) -> np.ndarray:
+    """
+    Vectorized american_to_decimal for an array of American odds.
+
+    Args:
+        odds (array-like): American odds. Positive for underdogs, negative for favorites.
+
+    Returns:
+        np.ndarray: Decimal odds.
+    """
+
+    odds = _validate_odds_array(odds)
+    abs_odds = np.abs(odds)
+    return 1 + np.where(odds > 0, abs_odds / 100, 100 / abs_odds)
+
+
+@lru_cache(maxsize=256)
+def _payout_multiplier(odds: int) -> float:
+    """Profit per unit staked for American odds."""
+
+    if odds == 0:
+        raise ValueError("Odds cannot be zero.")
+
+    if odds > 0:
+        return odds / 100
+    else:
+        return 100 / abs(odds)
+
+
 def payout_profit(odds: int, stake: float) -> float:
     """
     Calculate the profit from a bet given American odds and stake.
@@ -59,16 +120,10 @@ def payout_profit(odds: int, stake: float) -> float:
         float: The profit from the bet.     
     """
     
-    if odds == 0:
-        raise ValueError("Odds cannot be zero.")
-    
-    if odds > 0:
-        profit = (odds / 100) * stake
-    else:
-        profit = (100 / abs(odds)) * stake
-    return profit
+    return _payout_multiplier(odds) * stake
 
 
+@lru_cache(maxsize=256)
 def break_even_probability(odds: int) -> float:
     """
     Alias for implied probability.
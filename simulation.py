@@ -6,14 +6,45 @@ Refactored Monte Carlo simulation module.
 Design:
 - simulate_single_path: low-level engine (one path, drawdown, ruin)
 - run_strategy_simulation: Monte Carlo framework (many paths, distributions)
+- simulate_multiplicative_paths: closed-form fast path for fixed-fraction and flat strategies
+- simulate_compiled_paths: Numba-compiled engine for the built-in strategy kinds
+- simulate_vectorized_paths: NumPy engine for the built-in kinds when Numba is missing
 - simulate_kelly_paths: convenience wrapper for Kelly-based strategies
 """
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Any, List, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Any, Optional
 import numpy as np
 
+from jit import NUMBA_AVAILABLE, njit, prange
+from strategies import (
+    DRAWDOWN_KELLY,
+    FLAT,
+    FRACTION,
+    KELLY,
+    StrategyDescriptor,
+    compute_stake,
+)
+
+
+# Strategy kinds the compiled kernel knows how to size
+COMPILED_KINDS = (FLAT, FRACTION, KELLY, DRAWDOWN_KELLY)
+
+# Below this many simulations, process start-up costs more than it saves
+PARALLEL_MIN_SIMS = 500
+
+# Simulations per task in the parallel engine. Each block gets its own seed, so
+# results depend on seed alone, not on the number of workers.
+PARALLEL_BLOCK_SIMS = 256
+
+# Outcomes are drawn this many simulations at a time, so the outcome matrix is
+# O(DRAW_BLOCK_SIMS * n_bets) instead of O(n_sims * n_bets). Generator draws are
+# sequential, so blocks see the same outcomes as one full-size draw.
+DRAW_BLOCK_SIMS = 1024
 
 # Strategy function type:
 # bet_size_fn(current_bankroll, peak_bankroll, bet_index) -> stake (in dollars)
@@ -21,46 +52,53 @@ BetSizeFn = Callable[[float, float, int], float]
 
 
 def simulate_single_path(
-    prob_win: float,
     decimal_odds: float,
     initial_bankroll: float,
     n_bets: int,
     bet_size_fn: BetSizeFn,
     ruin_level: float,
-    rng: np.random.Generator,
+    outcomes: np.ndarray,
 ) -> Dict[str, Any]:
     """
     Simulate ONE bankroll trajectory.
 
     Args:
-        prob_win: Win probability (0 to 1).
         decimal_odds: Decimal odds (> 1).
         initial_bankroll: Starting bankroll.
         n_bets: Number of bets to simulate.
         bet_size_fn: Strategy stake function.
         ruin_level: Absolute bankroll level that triggers ruin (e.g., 0.4 * initial_bankroll).
-        rng: NumPy random generator for reproducibility.
+        outcomes: Boolean array of length n_bets, True where the bet wins. Drawn by
+            the caller (e.g. rng.random(n_bets) < prob_win) so no random state is
+            touched inside the loop.
 
     Returns:
         dict with:
-            - path: list[float] bankroll after each bet (including start)
+            - path: np.ndarray bankroll after each bet (including start)
             - final_bankroll: float
             - max_drawdown: float in [0, 1]
             - ruined: bool
     """
     bankroll = float(initial_bankroll)
     peak = float(initial_bankroll)
-    max_dd = 0.0
     ruined = False
 
     profit_mult = decimal_odds - 1.0
-    path: List[float] = [bankroll]
+    path = np.empty(n_bets + 1)
+    path[0] = bankroll
+    path_len = n_bets + 1
+
+    # Descriptors are sized by their generated stake function (one call per bet,
+    # min_bet/max_bet included); plain callables are called as-is.
+    if isinstance(bet_size_fn, StrategyDescriptor):
+        bet_size_fn = bet_size_fn.compile()
 
     for t in range(n_bets):
         if bankroll <= 0.0:
             bankroll = 0.0
             ruined = True
-            path.append(bankroll)
+            path[t + 1] = bankroll
+            path_len = t + 2
             break
 
         stake = float(bet_size_fn(bankroll, peak, t))
@@ -73,31 +111,32 @@ def simulate_single_path(
 
         # No-bet case
         if stake == 0.0:
-            path.append(bankroll)
+            path[t + 1] = bankroll
             continue
 
         # Outcome
-        if rng.random() < prob_win:
+        if outcomes[t]:
             bankroll += stake * profit_mult
         else:
             bankroll -= stake
 
-        # Peak + drawdown tracking
+        # Peak tracking (strategies may size on drawdown; max drawdown is computed after the loop)
         if bankroll > peak:
             peak = bankroll
 
-        if peak > 0:
-            dd = (peak - bankroll) / peak
-            if dd > max_dd:
-                max_dd = dd
-
-        path.append(bankroll)
+        path[t + 1] = bankroll
 
         # Ruin check (threshold-based)
         if bankroll <= ruin_level:
             ruined = True
+            path_len = t + 2
             break
 
+    path = path[:path_len]
+    peaks = np.maximum.accumulate(path)
+    drawdowns = np.divide(peaks - path, peaks, out=np.zeros_like(path), where=peaks > 0)
+    max_dd = float(drawdowns.max())
+
     return {
         "path": path,
         "final_bankroll": bankroll,
@@ -106,6 +145,472 @@ def simulate_single_path(
     }
 
 
+def _simulate_python_paths(
+    prob_win: float,
+    decimal_odds: float,
+    initial_bankroll: float,
+    n_bets: int,
+    n_sims: int,
+    bet_size_fn: BetSizeFn,
+    ruin_level: float,
+    n_paths_to_store: int,
+    seed: Any,
+) -> Dict[str, Any]:
+    """
+    Run simulate_single_path n_sims times. seed is anything np.random.default_rng
+    accepts (a Generator is used as-is). Returns the same structure as
+    simulate_multiplicative_paths.
+    """
+    rng = np.random.default_rng(seed)
+
+    final_arr = np.empty(n_sims)
+    dd_arr = np.empty(n_sims)
+    ruined_arr = np.zeros(n_sims, dtype=bool)
+    n_store = min(n_paths_to_store, n_sims)
+    sample_paths = np.empty((n_store, n_bets + 1))
+
+    for start in range(0, n_sims, DRAW_BLOCK_SIMS):
+        stop = min(start + DRAW_BLOCK_SIMS, n_sims)
+        # One generator call for every bet of a block of simulations.
+        outcomes = rng.random((stop - start, n_bets)) < prob_win
+
+        for i in range(start, stop):
+            result = simulate_single_path(
+                decimal_odds=decimal_odds,
+                initial_bankroll=initial_bankroll,
+                n_bets=n_bets,
+                bet_size_fn=bet_size_fn,
+                ruin_level=ruin_level,
+                outcomes=outcomes[i - start],
+            )
+
+            final_arr[i] = result["final_bankroll"]
+            dd_arr[i] = result["max_drawdown"]
+            ruined_arr[i] = result["ruined"]
+
+            if i < n_store:
+                path = result["path"]
+                sample_paths[i, : len(path)] = path
+                sample_paths[i, len(path):] = path[-1]
+
+    return {
+        "final_bankrolls": final_arr,
+        "max_drawdowns": dd_arr,
+        "ruined_flags": ruined_arr,
+        "sample_paths": sample_paths,
+    }
+
+
+def _simulate_python_paths_parallel(
+    prob_win: float,
+    decimal_odds: float,
+    initial_bankroll: float,
+    n_bets: int,
+    n_sims: int,
+    bet_size_fn: BetSizeFn,
+    ruin_level: float,
+    n_paths_to_store: int,
+    seed: Optional[int],
+    n_jobs: int,
+) -> Dict[str, Any]:
+    """
+    Split _simulate_python_paths into blocks of PARALLEL_BLOCK_SIMS simulations
+    and run them on n_jobs processes.
+
+    Each block gets its own seed spawned from seed, and blocks are reassembled in
+    order, so results are the same for any n_jobs. Workers are started with
+    "spawn" rather than fork: forking after Numba has started its threading
+    layer can deadlock the child.
+    """
+    starts = range(0, n_sims, PARALLEL_BLOCK_SIMS)
+    block_seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(starts))
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(
+                _simulate_python_paths,
+                prob_win, decimal_odds, initial_bankroll, n_bets,
+                min(PARALLEL_BLOCK_SIMS, n_sims - start), bet_size_fn, ruin_level,
+                max(n_paths_to_store - start, 0), block_seed,
+            )
+            for start, block_seed in zip(starts, block_seeds)
+        ]
+        blocks = [f.result() for f in futures]
+
+    return {
+        "final_bankrolls": np.concatenate([b["final_bankrolls"] for b in blocks]),
+        "max_drawdowns": np.concatenate([b["max_drawdowns"] for b in blocks]),
+        "ruined_flags": np.concatenate([b["ruined_flags"] for b in blocks]),
+        "sample_paths": np.concatenate([b["sample_paths"] for b in blocks]),
+    }
+
+
+@njit(cache=True, nogil=True)
+def _simulate_path_kernel(
+    wins, decimal_odds, initial_bankroll, kind, params, ruin_level, path_out, record,
+):
+    """
+    Compiled equivalent of simulate_single_path for one row of outcomes.
+
+    Returns (final_bankroll, max_drawdown, ruined). The path is only written to
+    path_out when record is True; bets after ruin repeat the final bankroll.
+    """
+    n_bets = wins.shape[0]
+    bankroll = initial_bankroll
+    peak = initial_bankroll
+    max_dd = 0.0
+    ruined = False
+    profit_mult = decimal_odds - 1.0
+    path_len = n_bets + 1
+
+    if record:
+        path_out[0] = bankroll
+
+    for t in range(n_bets):
+        if bankroll <= 0.0:
+            bankroll = 0.0
+            ruined = True
+            path_len = t + 2
+            break
+
+        stake = compute_stake(kind, params, bankroll, peak, t)
+
+        # Safety clamps
+        if stake < 0.0:
+            stake = 0.0
+        if stake > bankroll:
+            stake = bankroll
+
+        if stake == 0.0:
+            if record:
+                path_out[t + 1] = bankroll
+            continue
+
+        if wins[t]:
+            bankroll += stake * profit_mult
+        else:
+            bankroll -= stake
+
+        if bankroll > peak:
+            peak = bankroll
+        if peak > 0.0:
+            dd = (peak - bankroll) / peak
+            if dd > max_dd:
+                max_dd = dd
+
+        if record:
+            path_out[t + 1] = bankroll
+
+        if bankroll <= ruin_level:
+            ruined = True
+            path_len = t + 2
+            break
+
+    if record:
+        path_out[path_len:] = bankroll
+
+    return bankroll, max_dd, ruined
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _simulate_paths_kernel(
+    wins, decimal_odds, initial_bankroll, kind, params, ruin_level, n_paths_to_store,
+):
+    """Run _simulate_path_kernel over every row of wins in parallel."""
+    n_sims, n_bets = wins.shape
+    finals = np.empty(n_sims)
+    max_dds = np.empty(n_sims)
+    ruined = np.zeros(n_sims, dtype=np.bool_)
+    paths = np.empty((n_paths_to_store, n_bets + 1))
+    scratch = np.empty(0)
+
+    for i in prange(n_sims):
+        record = i < n_paths_to_store
+        path_out = paths[i] if record else scratch
+        final, dd, r = _simulate_path_kernel(
+            wins[i], decimal_odds, initial_bankroll, kind, params, ruin_level,
+            path_out, record,
+        )
+        finals[i] = final
+        max_dds[i] = dd
+        ruined[i] = r
+
+    return finals, max_dds, ruined, paths
+
+
+def simulate_compiled_paths(
+    prob_win: float,
+    decimal_odds: float,
+    initial_bankroll: float,
+    n_bets: int,
+    n_sims: int,
+    kind: int,
+    params: tuple,
+    ruin_level: float,
+    n_paths_to_store: int,
+    rng: np.random.Generator,
+) -> Dict[str, Any]:
+    """
+    Simulate ALL paths for a built-in strategy kind in compiled code.
+
+    Outcomes are drawn from rng ahead of each block of DRAW_BLOCK_SIMS paths, so
+    results are reproducible for a given seed regardless of how Numba schedules
+    paths across threads.
+
+    Args:
+        kind: Strategy kind from strategies.py (FLAT, FRACTION, KELLY, DRAWDOWN_KELLY).
+        params: Strategy params (param, max_drawdown, min_bet, max_bet), as returned
+            by StrategyDescriptor.as_kernel_args.
+        ruin_level: Absolute bankroll level that triggers ruin.
+        n_paths_to_store: Number of sample paths to return.
+        (other args as in simulate_single_path)
+
+    Returns:
+        Same structure as simulate_multiplicative_paths.
+    """
+    params = np.asarray(params, dtype=np.float64)
+    n_store = min(n_paths_to_store, n_sims)
+
+    finals = np.empty(n_sims)
+    max_dds = np.empty(n_sims)
+    ruined = np.empty(n_sims, dtype=bool)
+    paths = np.empty((n_store, n_bets + 1))
+
+    for start in range(0, n_sims, DRAW_BLOCK_SIMS):
+        stop = min(start + DRAW_BLOCK_SIMS, n_sims)
+        wins = rng.random((stop - start, n_bets)) < prob_win
+        block_store = max(min(n_store, stop) - start, 0)
+        (
+            finals[start:stop],
+            max_dds[start:stop],
+            ruined[start:stop],
+            paths[start:start + block_store],
+        ) = _simulate_paths_kernel(
+            wins, float(decimal_odds), float(initial_bankroll), int(kind), params,
+            float(ruin_level), block_store,
+        )
+
+    return {
+        "final_bankrolls": finals,
+        "max_drawdowns": max_dds,
+        "ruined_flags": ruined,
+        "sample_paths": paths,
+    }
+
+
+def simulate_vectorized_paths(
+    prob_win: float,
+    decimal_odds: float,
+    initial_bankroll: float,
+    n_bets: int,
+    n_sims: int,
+    strategy: StrategyDescriptor,
+    ruin_level: float,
+    n_paths_to_store: int,
+    rng: np.random.Generator,
+) -> Dict[str, Any]:
+    """
+    Simulate ALL paths for a built-in strategy with NumPy, without Numba.
+
+    Every simulation advances together: each bet is one strategy.stake_vec call
+    and a handful of array operations over n_sims, instead of n_sims Python-level
+    stake calls. Outcomes are drawn exactly as in simulate_compiled_paths, so both
+    engines give the same results for a given seed.
+
+    Args:
+        strategy: StrategyDescriptor of a kind in COMPILED_KINDS.
+        ruin_level: Absolute bankroll level that triggers ruin.
+        n_paths_to_store: Number of sample paths to return.
+        (other args as in simulate_single_path)
+
+    Returns:
+        Same structure as simulate_multiplicative_paths.
+    """
+    profit_mult = decimal_odds - 1.0
+    n_store = min(n_paths_to_store, n_sims)
+
+    finals = np.empty(n_sims)
+    max_dds = np.empty(n_sims)
+    ruined_flags = np.empty(n_sims, dtype=bool)
+    sample_paths = np.empty((n_store, n_bets + 1))
+
+    # Linear strategies (flat, fraction, Kelly) are sized in place as
+    # slope * bankroll + intercept, with no per-bet allocation.
+    linear = strategy.is_linear
+
+    # Blocks of DRAW_BLOCK_SIMS paths are simulated one after another; the
+    # state arrays below are views into the result arrays.
+    for start in range(0, n_sims, DRAW_BLOCK_SIMS):
+        stop = min(start + DRAW_BLOCK_SIMS, n_sims)
+        wins = rng.random((stop - start, n_bets)) < prob_win
+
+        bankroll = finals[start:stop]
+        bankroll.fill(initial_bankroll)
+        peak = bankroll.copy()
+        max_dd = max_dds[start:stop]
+        max_dd.fill(0.0)
+        ruined = ruined_flags[start:stop]
+        ruined.fill(False)
+        stored = sample_paths[start:stop]
+        n_stored = len(stored)
+        stored[:, 0] = bankroll[:n_stored]
+        stake = np.empty(stop - start)
+
+        for t in range(n_bets):
+            if linear:
+                np.multiply(bankroll, strategy.slope, out=stake)
+                stake += strategy.intercept
+                np.clip(stake, strategy.min_bet, strategy.max_bet, out=stake)
+            else:
+                stake = strategy.stake_vec(bankroll, peak, t)
+            # Safety clamps; ruined paths stop betting and stay frozen.
+            np.clip(stake, 0.0, bankroll, out=stake)
+            stake[ruined] = 0.0
+
+            bankroll += np.where(wins[:, t], stake * profit_mult, -stake)
+
+            np.maximum(peak, bankroll, out=peak)
+            np.maximum(max_dd, (peak - bankroll) / peak, out=max_dd)
+
+            ruined |= bankroll <= ruin_level
+            stored[:, t + 1] = bankroll[:n_stored]
+
+    return {
+        "final_bankrolls": finals,
+        "max_drawdowns": max_dds,
+        "ruined_flags": ruined_flags,
+        "sample_paths": sample_paths,
+    }
+
+
+def _to_host(arr: Any) -> np.ndarray:
+    """Copy a CuPy array back to host memory (NumPy arrays pass through)."""
+    return arr.get() if hasattr(arr, "get") else arr
+
+
+def simulate_multiplicative_paths(
+    prob_win: float,
+    decimal_odds: float,
+    initial_bankroll: float,
+    n_bets: int,
+    n_sims: int,
+    fraction: float,
+    ruin_level: float,
+    n_paths_to_store: int,
+    rng: Any,
+    xp: Any = np,
+    precision: str = "fp32",
+    flat_stake: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Simulate ALL paths at once for a strategy whose stake is f * bankroll + c.
+
+    Each bet multiplies the bankroll by (1 + f*(d-1)) on a win or (1 - f) on a loss
+    and then adds c*(d-1) or -c, so every path is a running affine product and all
+    simulations advance together with one vectorized multiply(-add) per bet. This
+    covers fixed-fraction and Kelly strategies (c = 0) and flat bets (f = 0).
+    Working memory is O(n_sims), independent of n_bets (apart from the stored
+    sample paths).
+
+    Args:
+        fraction: Fraction of current bankroll staked on every bet.
+        flat_stake: Fixed dollar amount staked on top of the fraction. The caller
+            must ensure the stake never exceeds the bankroll before ruin.
+        ruin_level: Absolute bankroll level that triggers ruin.
+        n_paths_to_store: Number of sample paths to return.
+        rng: Random generator from the same array module as xp.
+        xp: Array module (numpy, or cupy to run on the GPU). Only the per-simulation
+            results and the stored sample paths are copied back to host memory.
+        precision: "fp32" (default) or "fp64" for the draw, factor and path arrays.
+            float32 halves memory traffic; its ~1e-7 relative error is far below
+            the Monte Carlo standard error. Returned per-simulation results are
+            float64 either way.
+        (other args as in simulate_single_path)
+
+    Returns:
+        dict with:
+            - final_bankrolls: np.ndarray
+            - max_drawdowns: np.ndarray
+            - ruined_flags: np.ndarray
+            - sample_paths: np.ndarray of shape (n_paths_to_store, n_bets + 1);
+              paths that end early on ruin are padded with their final bankroll
+    """
+    dtype = xp.float32 if precision == "fp32" else xp.float64
+    fraction = min(max(fraction, 0.0), 1.0)
+    win_mult = dtype(1.0 + fraction * (decimal_odds - 1.0))
+    loss_mult = dtype(1.0 - fraction)
+    win_add = dtype(flat_stake * (decimal_odds - 1.0))
+    loss_add = dtype(-flat_stake)
+
+    # Outcomes are drawn one bet at a time and consumed immediately, so no
+    # (n_sims, n_bets) outcome or factor matrix is held. Bit-packing uniform
+    # random bits would shrink such a matrix 8x but only yields p = 0.5 exactly;
+    # per-step draws keep outcome memory at O(n_sims) without biasing prob_win.
+    #
+    # Peak, drawdown and ruin are folded into the same loop, so only a few
+    # length-n_sims vectors are carried instead of a full (n_sims, n_bets) path
+    # matrix. Only the first n_store paths are recorded for plotting.
+    n_store = min(n_paths_to_store, n_sims)
+    bankroll = xp.full(n_sims, initial_bankroll, dtype=dtype)
+    peak = bankroll.copy()
+    max_drawdowns = xp.zeros(n_sims, dtype=dtype)
+    drawdown = xp.empty(n_sims, dtype=dtype)
+    ruined = xp.zeros(n_sims, dtype=bool)
+    stored = xp.empty((n_store, n_bets + 1), dtype=dtype)
+    stored[:, 0] = initial_bankroll
+
+    for t in range(n_bets):
+        wins = rng.random(n_sims, dtype=dtype) < prob_win
+        factor = xp.where(wins, win_mult, loss_mult)
+        # Ruin stops betting, so ruined paths stay frozen at their ruin value.
+        factor[ruined] = 1
+        bankroll *= factor
+        if flat_stake:
+            shift = xp.where(wins, win_add, loss_add)
+            shift[ruined] = 0
+            bankroll += shift
+
+        xp.maximum(peak, bankroll, out=peak)
+        xp.subtract(peak, bankroll, out=drawdown)
+        drawdown /= peak
+        xp.maximum(max_drawdowns, drawdown, out=max_drawdowns)
+
+        ruined |= bankroll <= ruin_level
+        stored[:, t + 1] = bankroll[:n_store]
+
+    return {
+        "final_bankrolls": _to_host(bankroll).astype(np.float64),
+        "max_drawdowns": _to_host(max_drawdowns).astype(np.float64),
+        "ruined_flags": _to_host(ruined),
+        "sample_paths": _to_host(stored).astype(np.float64),
+    }
+
+
+def _affine_stake(bet_size_fn: BetSizeFn, ruin_level: float) -> Optional[tuple]:
+    """
+    (fraction, flat_stake) if simulate_multiplicative_paths reproduces bet_size_fn
+    exactly, else None.
+
+    Strategies tagged with a `bankroll_fraction` attribute qualify directly. A FLAT
+    descriptor stakes a constant even after its min/max clamps, and qualifies as
+    long as that stake is within ruin_level, so the stake <= bankroll safety clamp
+    can never bind on a path that is still alive.
+    """
+    fraction = getattr(bet_size_fn, "bankroll_fraction", None)
+    if fraction is not None:
+        return fraction, 0.0
+    if isinstance(bet_size_fn, StrategyDescriptor) and bet_size_fn.kind == FLAT:
+        stake = min(max(bet_size_fn.param, bet_size_fn.min_bet), bet_size_fn.max_bet)
+        if stake <= ruin_level:
+            return 0.0, stake
+    return None
+
+
 def run_strategy_simulation(
     prob_win: float,
     decimal_odds: float,
@@ -116,10 +621,20 @@ def run_strategy_simulation(
     ruin_threshold: float = 0.4,
     n_paths_to_store: int = 25,
     seed: Optional[int] = None,
+    backend: str = "numpy",
+    precision: str = "fp32",
+    n_jobs: int = 1,
 ) -> Dict[str, Any]:
     """
     Run MANY simulations for a single strategy and return distributions + sample paths.
 
+    Strategies tagged with a `bankroll_fraction` attribute (see strategies.py), and
+    flat bets that cannot outgrow the bankroll before ruin, are simulated with the
+    vectorized simulate_multiplicative_paths. Other built-in
+    strategies run in simulate_compiled_paths when Numba is installed, or in
+    simulate_vectorized_paths otherwise; any other bet_size_fn is simulated path
+    by path, optionally across worker processes.
+
     Args:
         prob_win: Win probability (0 to 1).
         decimal_odds: Decimal odds (> 1).
@@ -130,13 +645,27 @@ def run_strategy_simulation(
         ruin_threshold: Ruin defined as bankroll <= ruin_threshold * initial_bankroll.
         n_paths_to_store: Store this many sample paths for plotting.
         seed: Optional RNG seed for reproducibility.
+        backend: "numpy" (default) or "cupy" to run the fixed-fraction/flat fast
+            path on the GPU. The cupy backend requires CuPy and a strategy the fast
+            path accepts.
+        precision: "fp32" (default) or "fp64" working precision for the
+            fixed-fraction/flat fast path.
+        n_jobs: Worker processes for the path-by-path engine (-1 = all cores).
+            Each block of PARALLEL_BLOCK_SIMS simulations gets an independent
+            stream spawned from seed, so parallel results depend only on seed,
+            not on n_jobs or the core count (they differ from the serial stream).
+            bet_size_fn must be picklable by reference (e.g. a module-level
+            function or a descriptor). Ignored below PARALLEL_MIN_SIMS
+            simulations and for strategies handled by the vectorized or compiled
+            engines.
 
     Returns:
         dict with:
             - final_bankrolls: np.ndarray
             - max_drawdowns: np.ndarray
             - ruined_flags: np.ndarray
-            - sample_paths: list of list[float]
+            - sample_paths: np.ndarray of shape (n_paths_to_store, n_bets + 1);
+              paths that end early on ruin are padded with their final bankroll
             - summary: dict of key metrics
     """
     # Basic validation
@@ -152,36 +681,90 @@ def run_strategy_simulation(
         raise ValueError("ruin_threshold must be a fraction between 0 and 1.")
     if n_paths_to_store < 0:
         raise ValueError("n_paths_to_store must be >= 0.")
+    if backend not in ("numpy", "cupy"):
+        raise ValueError("backend must be 'numpy' or 'cupy'.")
+    if precision not in ("fp32", "fp64"):
+        raise ValueError("precision must be 'fp32' or 'fp64'.")
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError("n_jobs must be >= 1, or -1 for all cores.")
 
-    rng = np.random.default_rng(seed)
     ruin_level = ruin_threshold * initial_bankroll
-
-    final_bankrolls: List[float] = []
-    max_drawdowns: List[float] = []
-    ruined_flags: List[bool] = []
-    sample_paths: List[List[float]] = []
-
-    for _ in range(n_sims):
-        result = simulate_single_path(
+    affine = _affine_stake(bet_size_fn, ruin_level)
+    # Only real descriptors carry the fields the compiled/vectorized engines read;
+    # a plain callable that happens to have a `kind` attribute is not one.
+    kind = bet_size_fn.kind if isinstance(bet_size_fn, StrategyDescriptor) else None
+
+    if backend == "cupy" and affine is None:
+        raise ValueError("backend='cupy' only supports fixed-fraction and flat strategies.")
+
+    if backend == "cupy":
+        import cupy as cp  # optional dependency, only needed for GPU runs
+
+        xp = cp
+        rng = cp.random.default_rng(seed)
+    else:
+        xp = np
+        rng = np.random.default_rng(seed)
+
+    if affine is not None:
+        fraction, flat_stake = affine
+        fast = simulate_multiplicative_paths(
             prob_win=prob_win,
             decimal_odds=decimal_odds,
             initial_bankroll=initial_bankroll,
             n_bets=n_bets,
-            bet_size_fn=bet_size_fn,
+            n_sims=n_sims,
+            fraction=fraction,
             ruin_level=ruin_level,
+            n_paths_to_store=n_paths_to_store,
             rng=rng,
+            xp=xp,
+            precision=precision,
+            flat_stake=flat_stake,
         )
-
-        final_bankrolls.append(result["final_bankroll"])
-        max_drawdowns.append(result["max_drawdown"])
-        ruined_flags.append(result["ruined"])
-
-        if len(sample_paths) < n_paths_to_store:
-            sample_paths.append(result["path"])
-
-    final_arr = np.array(final_bankrolls, dtype=float)
-    dd_arr = np.array(max_drawdowns, dtype=float)
-    ruined_arr = np.array(ruined_flags, dtype=bool)
+        final_arr = fast["final_bankrolls"]
+        dd_arr = fast["max_drawdowns"]
+        ruined_arr = fast["ruined_flags"]
+        sample_paths = fast["sample_paths"]
+    elif kind in COMPILED_KINDS:
+        engine_args = dict(
+            prob_win=prob_win,
+            decimal_odds=decimal_odds,
+            initial_bankroll=initial_bankroll,
+            n_bets=n_bets,
+            n_sims=n_sims,
+            ruin_level=ruin_level,
+            n_paths_to_store=n_paths_to_store,
+            rng=rng,
+        )
+        if NUMBA_AVAILABLE:
+            kind, params = bet_size_fn.as_kernel_args()
+            compiled = simulate_compiled_paths(**engine_args, kind=kind, params=params)
+        else:
+            compiled = simulate_vectorized_paths(**engine_args, strategy=bet_size_fn)
+        final_arr = compiled["final_bankrolls"]
+        dd_arr = compiled["max_drawdowns"]
+        ruined_arr = compiled["ruined_flags"]
+        sample_paths = compiled["sample_paths"]
+    else:
+        common = dict(
+            prob_win=prob_win,
+            decimal_odds=decimal_odds,
+            initial_bankroll=initial_bankroll,
+            n_bets=n_bets,
+            n_sims=n_sims,
+            bet_size_fn=bet_size_fn,
+            ruin_level=ruin_level,
+            n_paths_to_store=n_paths_to_store,
+        )
+        if n_jobs == 1 or n_sims < PARALLEL_MIN_SIMS:
+            generic = _simulate_python_paths(**common, seed=rng)
+        else:
+            generic = _simulate_python_paths_parallel(**common, seed=seed, n_jobs=n_jobs)
+        final_arr = generic["final_bankrolls"]
+        dd_arr = generic["max_drawdowns"]
+        ruined_arr = generic["ruined_flags"]
+        sample_paths = generic["sample_paths"]
 
     summary = {
         "mean_final_bankroll": float(np.mean(final_arr)),
@@ -211,16 +794,20 @@ def simulate_kelly_paths(
     kelly_multiplier: float = 0.5,
     ruin_threshold: float = 0.4,
     seed: Optional[int] = None,
+    precision: str = "fp32",
 ) -> Dict[str, Any]:
     """
     Convenience wrapper: simulate a Kelly-style strategy without needing strategies.py.
 
-    This keeps your older API usable, while internally using the strategy-agnostic framework.
+    This keeps your older API usable, while internally using the strategy-agnostic
+    framework. The stake is a fixed fraction of bankroll, so it runs on the
+    vectorized simulate_multiplicative_paths fast path.
 
     Args:
         kelly_fraction: Base Kelly fraction (e.g., 0.04 means 4% bankroll).
         kelly_multiplier: Fractional Kelly (0.5 = half Kelly).
         ruin_threshold: Ruin threshold as a fraction of initial bankroll.
+        precision: Working precision passed to run_strategy_simulation.
 
     Returns:
         Same output structure as run_strategy_simulation.
@@ -230,9 +817,8 @@ def simulate_kelly_paths(
     if not (0.0 <= kelly_multiplier <= 1.0):
         raise ValueError("kelly_multiplier must be between 0 and 1.")
 
-    def kelly_bet_fn(bankroll: float, peak: float, t: int) -> float:
-        frac = max(0.0, kelly_fraction) * kelly_multiplier
-        return bankroll * frac
+    # Stakes are capped at the bankroll, so fractions above 1 behave like 1.
+    bet_frac = min(kelly_fraction * kelly_multiplier, 1.0)
 
     return run_strategy_simulation(
         prob_win=prob_win,
@@ -240,7 +826,8 @@ def simulate_kelly_paths(
         initial_bankroll=initial_bankroll,
         n_bets=n_bets,
         n_sims=n_sims,
-        bet_size_fn=kelly_bet_fn,
+        bet_size_fn=StrategyDescriptor(kind=FRACTION, param=bet_frac),
         ruin_threshold=ruin_threshold,
         seed=seed,
-    )
\ No newline at end of file
+        precision=precision,
+    )
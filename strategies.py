@@ -3,19 +3,364 @@ strategies.py
 
 Bet sizing strategies for bankroll simulations.
 
-Each strategy returns a function (closure) with signature:
+Each strategy returns a callable with signature:
     bet_size_fn(current_bankroll, peak_bankroll, bet_index) -> stake_amount(float)
 
 This keeps simulation logic (outcoes/risk metrics) separate from sizing logic,
 so you can easily compare strategies under identical conditions.
+
+Built-in strategies return a StrategyDescriptor: plain data (an integer `kind`
+plus a few floats) that is also callable. simulation.py reads the fields to
+size bets in a compiled kernel or with whole-array NumPy operations, and
+falls back to the descriptor's generated stake function (see compile()).
+Arbitrary user functions still work anywhere a bet_size_fn is expected.
+
+Descriptors also expose stake_vec, which sizes a whole array of bankrolls at
+once so many simulated paths can be advanced together, and compile(), which
+generates a plain function with the strategy's constants inlined.
+
+flat_bet, fixed_fraction and kelly_fraction_strategy are memoized on their
+arguments: a parameter sweep that rebuilds the same strategy gets the same
+(immutable) descriptor object back, so callers must not rely on getting a
+fresh instance.
 """
 
 from __future__ import annotations
 
-from typing import Callable
+import math
+import struct
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from jit import NUMBA_AVAILABLE, njit, prange
+from kelly import (
+    edge_adjusted_kelly,
+    kelly_fraction,
+    kelly_fraction_vec,
+    uncertainty_adjusted_kelly,
+)
 
 BetSizeFn = Callable[[float, float, int], float]  # current_bankroll, peak_bankroll, bet_index -> stake
 
+# Strategy kinds understood by the compiled simulation kernel
+CUSTOM = -1         # stake = fn(bankroll, peak, t) for a user-supplied fn
+FLAT = 0            # stake = param
+FRACTION = 1        # stake = bankroll * param
+KELLY = 2           # stake = bankroll * param (param = multiplied Kelly fraction)
+DRAWDOWN_KELLY = 3  # stake = bankroll * param, scaled down linearly as drawdown approaches max_drawdown
+
+# Packed layout of a built-in descriptor: kind, param, max_drawdown, min_bet, max_bet (33 bytes)
+_PACKED_FORMAT = struct.Struct("<b4d")
+
+
+@lru_cache(maxsize=256)
+def _compile_stake_fn(
+    kind: int,
+    param: float,
+    max_drawdown: float,
+    lo: float,
+    hi: float,
+    fn: Optional[BetSizeFn],
+) -> BetSizeFn:
+    """
+    Generate a bet_size_fn for one descriptor with every constant as a literal.
+
+    The source is built and exec'd once per distinct descriptor, so each call is a
+    single frame of float arithmetic and comparisons against constants: no kind
+    dispatch, no attribute lookups. An infinite upper bound is left out entirely,
+    and a flat stake is folded to a constant at build time.
+    """
+    namespace = {"_fn": fn}
+
+    def const(x: float) -> str:
+        # repr() of inf/nan is not valid source, so those are bound by name instead.
+        x = float(x)
+        if math.isfinite(x):
+            return repr(x)
+        name = f"_c{len(namespace)}"
+        namespace[name] = x
+        return name
+
+    if kind == FLAT:
+        lines = [f"    return {const(min(max(param, lo), hi))}"]
+    else:
+        if kind == FRACTION or kind == KELLY:
+            lines = [f"    v = b * {const(param)}"]
+        elif kind == DRAWDOWN_KELLY:
+            # b * drawdown_adjusted_kelly(...) written out, in the same operation
+            # order, so stakes match _drawdown_kelly_stake bit for bit.
+            k, md = const(param), const(max_drawdown)
+            lines = [
+                "    if p > 0:",
+                "        dd = (p - b) / p",
+                f"        v = 0.0 if dd >= {md} else b * ({k} * (1 - dd / {md}))",
+                "    else:",
+                f"        v = b * {k}",
+            ]
+        else:
+            lines = ["    v = _fn(b, p, t)"]
+
+        if lo > hi:
+            # min(max(v, lo), hi) is always hi here
+            lines.append(f"    return {const(hi)}")
+        else:
+            lines.append(f"    if v < {const(lo)}: return {const(lo)}")
+            if hi != math.inf:
+                lines.append(f"    if v > {const(hi)}: return {const(hi)}")
+            lines.append("    return v")
+
+    source = "\n".join(["def stake(b, p, t):"] + lines)
+    exec(compile(source, "<strategy>", "exec"), namespace)
+    return namespace["stake"]
+
+
+@njit(cache=True, nogil=True)
+def _drawdown_kelly_stake(bankroll, peak, fraction, max_drawdown):
+    """
+    DRAWDOWN_KELLY stake for one bet: drawdown_adjusted_kelly from kelly.py inlined
+    and multiplied by the bankroll. fraction is the cached edge/uncertainty/multiplier
+    fraction from risk_adjusted_kelly_strategy. Operations are ordered as in
+    bankroll * drawdown_adjusted_kelly(...) so both give identical stakes.
+    """
+    if peak <= 0.0:
+        return bankroll * fraction
+    if max_drawdown <= 0.0:
+        return 0.0
+    drawdown = (peak - bankroll) / peak
+    # Branchless max(scale, 0): scale <= 0 exactly when drawdown >= max_drawdown,
+    # and 0.5 * (x + |x|) is exact, so results match the if/else form bit for bit.
+    scale = 1.0 - drawdown / max_drawdown
+    scale = 0.5 * (scale + abs(scale))
+    return bankroll * (fraction * scale)
+
+
+@njit(cache=True, nogil=True)
+def compute_stake(kind, params, bankroll, peak, t):
+    """
+    Stake for one bet of a built-in strategy, callable from compiled code.
+
+    (kind, params) is the pair returned by StrategyDescriptor.as_kernel_args, with
+    params = [param, max_drawdown, min_bet, max_bet]. CUSTOM strategies cannot be
+    sized here and get a stake of 0. t is accepted to match bet_size_fn.
+    """
+    param = params[0]
+    if kind == FLAT:
+        stake = param
+    elif kind == FRACTION or kind == KELLY:
+        stake = bankroll * param
+    elif kind == DRAWDOWN_KELLY:
+        stake = _drawdown_kelly_stake(bankroll, peak, param, params[1])
+    else:
+        stake = 0.0
+    return min(max(stake, params[2]), params[3])
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _drawdown_kelly_stake_batch(bankroll, peak, fraction, max_drawdown):
+    """_drawdown_kelly_stake over arrays of bankrolls and peaks, one path per thread."""
+    out = np.empty(bankroll.shape[0])
+    for i in prange(bankroll.shape[0]):
+        out[i] = _drawdown_kelly_stake(bankroll[i], peak[i], fraction, max_drawdown)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyDescriptor:
+    """
+    Data-only description of a bet sizing strategy.
+
+    The stake for `kind` is computed from `param` (and `max_drawdown` for
+    DRAWDOWN_KELLY), then clamped to [min_bet, max_bet]. CUSTOM descriptors wrap
+    an arbitrary bet_size_fn in `fn` so the same clamps can be applied to it.
+    """
+
+    kind: int
+    param: float = 0.0
+    max_drawdown: float = 0.0
+    min_bet: float = 0.0
+    max_bet: float = math.inf
+    fn: Optional[BetSizeFn] = None
+    _compiled: BetSizeFn = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once here so __call__ is a single call to the generated function.
+        args = (self.kind, self.param, self.max_drawdown, self.min_bet, self.max_bet, self.fn)
+        try:
+            hash(self.fn)
+        except TypeError:
+            # Unhashable callables (e.g. a plain @dataclass with __call__)
+            # cannot key the shared cache, so build an uncached function.
+            compiled = _compile_stake_fn.__wrapped__(*args)
+        else:
+            compiled = _compile_stake_fn(*args)
+        object.__setattr__(self, "_compiled", compiled)
+
+    def __call__(self, bankroll: float, peak: float, t: int) -> float:
+        return self._compiled(bankroll, peak, t)
+
+    def stake_vec(self, bankroll: np.ndarray, peak: np.ndarray, t: int = 0) -> np.ndarray:
+        """
+        Vectorized __call__: stakes for an array of bankrolls (one per path).
+
+        Built-in kinds are a few whole-array operations; CUSTOM falls back to
+        calling fn once per element.
+        """
+        bankroll = np.asarray(bankroll, dtype=float)
+        kind = self.kind
+        if kind == FLAT:
+            stake = np.full_like(bankroll, self.param)
+        elif kind == FRACTION or kind == KELLY:
+            stake = bankroll * self.param
+        elif kind == DRAWDOWN_KELLY and NUMBA_AVAILABLE:
+            peak = np.broadcast_to(np.asarray(peak, dtype=float), bankroll.shape)
+            stake = _drawdown_kelly_stake_batch(
+                bankroll.ravel(), np.ascontiguousarray(peak).ravel(),
+                self.param, self.max_drawdown,
+            ).reshape(bankroll.shape)
+        elif kind == DRAWDOWN_KELLY:
+            peak = np.asarray(peak, dtype=float)
+            stake = bankroll * self.param
+            has_peak = peak > 0
+            drawdown = np.divide(peak - bankroll, peak, out=np.zeros_like(bankroll), where=has_peak)
+            if self.max_drawdown > 0:
+                # 1 - dd/max_dd is <= 0 exactly when dd >= max_dd, so clipping at 0
+                # reproduces the scalar cut-off.
+                scale = np.maximum(1.0 - drawdown / self.max_drawdown, 0.0)
+            else:
+                scale = np.zeros_like(bankroll)
+            stake = np.where(has_peak, bankroll * (self.param * scale), stake)
+        else:
+            # Broadcast first so scalar (0-d) inputs work like they do for built-in kinds.
+            bankroll, peak = np.broadcast_arrays(bankroll, np.asarray(peak, dtype=float))
+            stake = np.fromiter(
+                (self.fn(b, p, t) for b, p in zip(bankroll.ravel(), peak.ravel())),
+                dtype=float,
+                count=bankroll.size,
+            ).reshape(bankroll.shape)
+        return np.minimum(np.maximum(stake, self.min_bet), self.max_bet)
+
+    def compile(self) -> BetSizeFn:
+        """
+        This strategy as a generated plain function with its constants inlined.
+
+        This is the one Python definition of each kind's stake: __call__ and
+        simulate_single_path both run it. It is built when the descriptor is
+        created and memoized across equal descriptors.
+        """
+        return self._compiled
+
+    def __reduce__(self):
+        # Rebuild through the constructor: a compact positional tuple instead of
+        # a pickled slot-state dict.
+        return (
+            StrategyDescriptor,
+            (self.kind, self.param, self.max_drawdown, self.min_bet, self.max_bet, self.fn),
+        )
+
+    def to_tuple(self) -> Tuple[int, float, float, float, float]:
+        """(kind, param, max_drawdown, min_bet, max_bet) as plain data, for built-in kinds."""
+        if self.kind == CUSTOM:
+            raise ValueError("CUSTOM strategies wrap a callable and cannot be reduced to plain data.")
+        return (self.kind, self.param, self.max_drawdown, self.min_bet, self.max_bet)
+
+    @classmethod
+    def from_tuple(cls, values: Tuple[int, float, float, float, float]) -> StrategyDescriptor:
+        """Inverse of to_tuple."""
+        kind, param, max_drawdown, min_bet, max_bet = values
+        return cls(int(kind), float(param), float(max_drawdown), float(min_bet), float(max_bet))
+
+    def to_bytes(self) -> bytes:
+        """to_tuple packed into 33 bytes, e.g. to ship a sweep of strategies to worker processes."""
+        return _PACKED_FORMAT.pack(*self.to_tuple())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> StrategyDescriptor:
+        """Inverse of to_bytes."""
+        return cls.from_tuple(_PACKED_FORMAT.unpack(data))
+
+    def as_kernel_args(self) -> Tuple[int, np.ndarray]:
+        """(kind, float64 params array) for compute_stake and the compiled simulation kernels."""
+        return self.kind, np.array(self.params, dtype=np.float64)
+
+    @property
+    def params(self) -> Tuple[float, float, float, float]:
+        """(param, max_drawdown, min_bet, max_bet) as consumed by the compiled kernel."""
+        return (self.param, self.max_drawdown, self.min_bet, self.max_bet)
+
+    @property
+    def bankroll_fraction(self) -> Optional[float]:
+        """Fraction of bankroll staked every bet, or None if the stake is not a pure fraction."""
+        if self.kind in (FRACTION, KELLY) and self.min_bet == 0.0 and self.max_bet == math.inf:
+            return self.param
+        return None
+
+    @property
+    def is_linear(self) -> bool:
+        """True if the unclamped stake is slope * bankroll + intercept."""
+        return self.kind in (FLAT, FRACTION, KELLY)
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Stake per dollar of bankroll for linear strategies, else None."""
+        if not self.is_linear:
+            return None
+        return 0.0 if self.kind == FLAT else self.param
+
+    @property
+    def intercept(self) -> Optional[float]:
+        """Constant stake component for linear strategies, else None."""
+        if not self.is_linear:
+            return None
+        return self.param if self.kind == FLAT else 0.0
+
+
+@dataclass(eq=False)
+class KellyStrategyBatch:
+    """
+    Many Kelly strategies stored column-wise, for parameter sweeps.
+
+    Instead of building one descriptor per (prob_win, odds, kelly_multiplier)
+    combination, the parameters are kept as parallel arrays and the Kelly
+    fractions are computed for all of them in one vectorized call.
+
+    Args:
+        prob_win: Estimated win probabilities (between 0 and 1).
+        odds: American odds, one per strategy.
+        kelly_multiplier: Fractions of Kelly to use (between 0 and 1).
+    """
+
+    prob_win: np.ndarray
+    odds: np.ndarray
+    kelly_multiplier: np.ndarray
+    kelly_frac: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.prob_win, self.odds, self.kelly_multiplier = np.broadcast_arrays(
+            np.asarray(self.prob_win, dtype=float),
+            np.asarray(self.odds, dtype=float),
+            np.asarray(self.kelly_multiplier, dtype=float),
+        )
+        if np.any((self.kelly_multiplier < 0) | (self.kelly_multiplier > 1)):
+            raise ValueError("Kelly multiplier must be between 0 and 1.")
+
+        self.kelly_frac = kelly_fraction_vec(self.prob_win, self.odds) * self.kelly_multiplier
+
+    def __len__(self) -> int:
+        return self.kelly_frac.size
+
+    def __getitem__(self, i: int) -> StrategyDescriptor:
+        """The i-th strategy as a descriptor, e.g. for run_strategy_simulation."""
+        return StrategyDescriptor(kind=KELLY, param=float(self.kelly_frac.flat[i]))
+
+    def stake(self, bankroll: np.ndarray, peak: Optional[np.ndarray] = None) -> np.ndarray:
+        """Stake of every strategy for its own bankroll (peak is unused by Kelly)."""
+        return np.asarray(bankroll, dtype=float) * self.kelly_frac
+
+
+@lru_cache(maxsize=256)
 def flat_bet(stake: float) -> BetSizeFn:
     """
     Flat betting strategy: wager a constant dollar amount each bet.
@@ -24,18 +369,16 @@ def flat_bet(stake: float) -> BetSizeFn:
         stake: Fixed stake in dollars (e.g., 10.0 for $10 bets).
     
     Returns:
-        A bet_size_fn that always returns 'stake'.
+        A StrategyDescriptor that always stakes 'stake'.
         (simulation.py should clamp stake to <= bankroll)
     """
 
     if stake < 0:
         raise ValueError("Stake must be >= 0")
     
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        return stake
-    
-    return fn
+    return StrategyDescriptor(kind=FLAT, param=float(stake))
 
+@lru_cache(maxsize=256)
 def fixed_fraction(fraction: float) -> BetSizeFn:
     """
     Fixed fraction betting strategy: wager a constant fraction of current bankroll.
@@ -44,18 +387,16 @@ def fixed_fraction(fraction: float) -> BetSizeFn:
         fraction: Fraction of bankroll to wager (between 0 and 1).
     
     Returns:
-        A bet_size_fn that returns 'fraction' * current_bankroll.
+        A StrategyDescriptor that stakes 'fraction' * current_bankroll.
     """
 
     if not (0 <= fraction <= 1):
         raise ValueError("Fraction must be between 0 and 1.")
     
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        return bankroll * fraction
-    
-    return fn
+    return StrategyDescriptor(kind=FRACTION, param=float(fraction))
 
 
+@lru_cache(maxsize=256)
 def kelly_fraction_strategy(
     prob_win: float,
     odds: int,
@@ -70,11 +411,9 @@ def kelly_fraction_strategy(
         kelly_multiplier: Fraction of Kelly fraction to use (between 0 and 1).
 
     Returns:
-        A bet_size_fn that computes stake based on Kelly Criterion.
+        A StrategyDescriptor that stakes the (fractional) Kelly fraction of bankroll.
     """
 
-    from kelly import kelly_fraction  # Import here to avoid circular dependency
-
     if not (0 <= prob_win <= 1):
         raise ValueError("Probability must be between 0 and 1.")
     
@@ -83,10 +422,7 @@ def kelly_fraction_strategy(
     
     kelly_frac = kelly_fraction(prob_win, odds) * kelly_multiplier
 
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        return bankroll * kelly_frac
-    
-    return fn
+    return StrategyDescriptor(kind=KELLY, param=float(kelly_frac))
 
 
 def min_bet_wrapper(base_strategy: BetSizeFn, min_bet: float) -> BetSizeFn:
@@ -100,17 +436,14 @@ def min_bet_wrapper(base_strategy: BetSizeFn, min_bet: float) -> BetSizeFn:
         min_bet: Minimum bet size in dollars.
 
     Returns:
-        A bet_size_fn that enforces the minimum bet size.
+        A StrategyDescriptor that enforces the minimum bet size, or base_strategy
+        itself when min_bet is 0 (a no-op: simulations never stake below 0).
     """
 
     if min_bet < 0:
         raise ValueError("Minimum bet must be >= 0.")
     
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        base_bet = base_strategy(bankroll, peak, t)
-        return max(base_bet, min_bet)
-    
-    return fn
+    return clamped_bet_wrapper(base_strategy, lo=min_bet)
 
 
 def capped_bet_wrapper(base_strategy: BetSizeFn, max_bet: float) -> BetSizeFn:
@@ -122,17 +455,57 @@ def capped_bet_wrapper(base_strategy: BetSizeFn, max_bet: float) -> BetSizeFn:
         max_bet: Maximum bet size in dollars.
 
     Returns:
-        A bet_size_fn that enforces the maximum bet size.
+        A StrategyDescriptor that enforces the maximum bet size, or base_strategy
+        itself when max_bet is infinite.
     """
 
     if max_bet < 0:
         raise ValueError("Maximum bet must be >= 0.")
     
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        base_bet = base_strategy(bankroll, peak, t)
-        return min(base_bet, max_bet)
-    
-    return fn
+    return clamped_bet_wrapper(base_strategy, hi=max_bet)
+
+
+def clamped_bet_wrapper(
+    base_strategy: BetSizeFn,
+    lo: float = 0.0,
+    hi: float = math.inf,
+) -> BetSizeFn:
+    """
+    Wrapper to clamp any base strategy's stake to [lo, hi] in one step.
+
+    min_bet_wrapper and capped_bet_wrapper are both built on this, so stacking
+    them in any order still yields a single descriptor with one clamp per bet.
+
+    Args:
+        base_strategy: The underlying bet sizing strategy.
+        lo: Minimum bet size in dollars.
+        hi: Maximum bet size in dollars.
+
+    Returns:
+        A StrategyDescriptor that stakes min(max(base stake, lo), hi), or
+        base_strategy itself when lo is 0 and hi is infinite.
+    """
+
+    if lo < 0 or hi < 0:
+        raise ValueError("Bet bounds must be >= 0.")
+    if lo > hi:
+        raise ValueError("Minimum bet must be <= maximum bet.")
+
+    # No-op bounds: pass the base through rather than adding a layer.
+    if lo == 0.0 and hi == math.inf:
+        return base_strategy
+
+    # A descriptor already clamps to [min_bet, max_bet]. Clamping that result
+    # to [lo, hi] equals one clamp to [max(min_bet, lo), min(max_bet, hi)]
+    # unless the new floor lies above the existing cap.
+    if isinstance(base_strategy, StrategyDescriptor) and lo <= base_strategy.max_bet:
+        return replace(
+            base_strategy,
+            min_bet=max(base_strategy.min_bet, float(lo)),
+            max_bet=min(base_strategy.max_bet, float(hi)),
+        )
+
+    return StrategyDescriptor(kind=CUSTOM, fn=base_strategy, min_bet=float(lo), max_bet=float(hi))
 
 
 def risk_adjusted_kelly_strategy(
@@ -148,9 +521,12 @@ def risk_adjusted_kelly_strategy(
 
     1) edge_adjusted_kelly(prob_win, decimal_odds, edge_threshold)
     2) uncertainty_adjusted_kelly(prob_win, decimal_odds, prob_std)
-    3) drawdown_adjusted_kelly(kelly_fraction, current_bankroll, peak_bankroll, max_drawdown)
+    3) drawdown adjustment (as in drawdown_adjusted_kelly) from current and peak bankroll
     4) apply kelly_multiplier (fractional kelly)
 
+    Steps 1, 2 and 4 do not depend on the bankroll, so they are evaluated once here
+    and cached as a single fraction. Per bet only the drawdown factor is applied.
+
     Args:
         prob_win: Estimated probability of winning the bet (between 0 and 1).
         decimal_odds: Decimal odds for the bet.
@@ -160,7 +536,7 @@ def risk_adjusted_kelly_strategy(
         max_drawdown: Maximum acceptable drawdown as a fraction of peak bankroll.
     
     Returns:
-        A bet_size_fn that computes stake based on risk-adjusted Kelly Criterion.
+        A StrategyDescriptor that computes stake based on risk-adjusted Kelly Criterion.
     """
     if not (0 <= prob_win <= 1):
         raise ValueError("Probability must be between 0 and 1.")
@@ -176,23 +552,13 @@ def risk_adjusted_kelly_strategy(
         raise ValueError("Max drawdown must be between 0 and 1.")
     
 
-    from kelly import (
-        edge_adjusted_kelly,
-        uncertainty_adjusted_kelly,
-        drawdown_adjusted_kelly,
-    )
-
-    def fn(bankroll: float, peak: float, t: int) -> float:
-        k_edge = edge_adjusted_kelly(prob_win, decimal_odds, edge_threshold)
-        k_unc = uncertainty_adjusted_kelly(prob_win, decimal_odds, prob_std)
-        k = max(0.0, min(k_edge, k_unc))
-
-        k = drawdown_adjusted_kelly(k, bankroll, peak, max_drawdown)
-
-        k *= kelly_multiplier
+    k_edge = edge_adjusted_kelly(prob_win, decimal_odds, edge_threshold)
+    k_unc = uncertainty_adjusted_kelly(prob_win, decimal_odds, prob_std)
+    fraction = max(0.0, min(k_edge, k_unc)) * kelly_multiplier
 
-
-        return bankroll * k
-    
-    return fn
+    return StrategyDescriptor(
+        kind=DRAWDOWN_KELLY,
+        param=float(fraction),
+        max_drawdown=float(max_drawdown),
+    )
 